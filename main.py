@@ -14,6 +14,7 @@ from utils import (
     use_saved_settings,
     get_website_version
 )
+from vacancy_filter import VacancyFilter
 from vacancy_processor import process_resume_vacancies
 
 # Константы
@@ -31,16 +32,40 @@ async def main() -> None:
     # Создаем аккаунты и собираем все уникальные поисковые запросы
     accounts = []
     all_search_queries = set()
+    query_criteria: Dict[str, Dict] = {}  # Фильтры и исключения для каждого поискового запроса
+    employer_responses: Dict[str, int] = {}  # Отклики по работодателям, общие для всех запросов за запуск
     
     for account_data in accounts_data:
-        resumes = [
-            Resume(
-                hash=resume["hash"], 
-                query=resume["search_criteria"]["query"],
-                blacklist=resume["search_criteria"].get("exclude_words", [])
-            ) 
-            for resume in account_data["resumes"]
-        ]
+        try:
+            resumes = [
+                Resume(
+                    hash=resume["hash"], 
+                    query=resume["search_criteria"]["query"],
+                    vacancy_filter=VacancyFilter.from_config(
+                        resume["search_criteria"].get("filters"),
+                        blacklist=resume["search_criteria"].get("exclude_words", []),
+                        employer_responses=employer_responses
+                    )
+                ) 
+                for resume in account_data["resumes"]
+            ]
+        except ValueError as error:
+            print(f"Некорректные фильтры в {ACCOUNTS_FILE} (аккаунт {account_data['email']}): {error}")
+            return
+
+        # Вакансии запроса фильтруются одним фильтром, поэтому у резюме с одинаковым query критерии должны совпадать
+        for resume in account_data["resumes"]:
+            criteria = {
+                "filters": resume["search_criteria"].get("filters") or {},
+                "exclude_words": resume["search_criteria"].get("exclude_words", []),
+            }
+            query = resume["search_criteria"]["query"]
+            if query_criteria.setdefault(query, criteria) != criteria:
+                print(
+                    f"Резюме с запросом '{query}' имеют разные filters/exclude_words "
+                    f"(аккаунт {account_data['email']}). Укажите одинаковые критерии для одного запроса."
+                )
+                return
         if resumes:  # Создаем аккаунт только если есть резюме
             accounts.append(Account(email=account_data["email"], resumes=resumes))
             for resume in resumes:
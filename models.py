@@ -4,16 +4,23 @@ import asyncio
 from typing import Dict, List, Optional
 from aiohttp import FormData
 
+from vacancy_filter import VacancyFilter
+
 # Константы
 COOKIES_DIR = "cookies"
 
 class Resume:
     """Класс для управления резюме."""
     
-    def __init__(self, hash: str, query: str, blacklist: List[str] = None):
+    def __init__(self, hash: str, query: str, vacancy_filter: Optional[VacancyFilter] = None):
         self.hash = hash
         self.query = query  # Поисковый запрос для данного резюме
-        self.blacklist = blacklist or []  # Список исключаемых слов/фраз
+        self.vacancy_filter = vacancy_filter or VacancyFilter()  # Фильтр по полям вакансии
+
+    @property
+    def blacklist(self) -> List[str]:
+        """Список исключаемых слов/фраз, хранится в фильтре вакансий."""
+        return self.vacancy_filter.blacklist
 
 
 class Account:
@@ -0,0 +1,164 @@
+import pytest
+
+from vacancy_filter import VacancyFilter
+
+
+def make_vacancy(name="Python разработчик", **fields):
+    """Создает вакансию в формате поисковой выдачи hh.ru."""
+    vacancy = {
+        "name": name,
+        "vacancyId": 1,
+        "compensation": {"from": 200000, "to": 250000, "currencyCode": "RUR"},
+        "company": {"@id": 10, "name": "Good Company"},
+        "area": {"@id": 1, "name": "Москва"},
+        "@workSchedule": "remote",
+    }
+    vacancy.update(fields)
+    return vacancy
+
+
+def names(vacancies):
+    return [vacancy["name"] for vacancy in vacancies]
+
+
+def test_from_config_empty_filter_passes_everything():
+    vacancy_filter = VacancyFilter.from_config(None)
+    vacancies = [make_vacancy(compensation={"noCompensation": True})]
+
+    assert vacancy_filter.is_empty
+    assert vacancy_filter.filter_vacancies(vacancies) is vacancies
+
+
+def test_from_config_null_sections_and_numeric_strings():
+    vacancy_filter = VacancyFilter.from_config(
+        {"salary": {"min": "150000"}, "employers": None, "areas": None}
+    )
+
+    assert vacancy_filter.salary_min == 150000
+    assert vacancy_filter.max_responses_per_employer is None
+
+
+@pytest.mark.parametrize("config, message", [
+    ({"salery": {"min": 1}}, "salery"),
+    ({"salary": {"minimum": 1}}, "minimum"),
+    ({"employers": {"max_responses": "five"}}, "employers.max_responses"),
+    ({"salary": {"min": [1]}}, "salary.min"),
+    ({"areas": "Москва"}, "areas"),
+    ({"salary": 150000}, "salary"),
+    ({"salary": {"allow_missing": "false"}}, "salary.allow_missing"),
+    ({"salary": {"allow_other_currency": 0}}, "salary.allow_other_currency"),
+    ({"salary": {"min": True}}, "salary.min"),
+    ({"employers": {"max_responses": 0}}, "employers.max_responses"),
+    ({"employers": {"max_responses": -1}}, "employers.max_responses"),
+])
+def test_from_config_rejects_invalid_config(config, message):
+    with pytest.raises(ValueError, match=message):
+        VacancyFilter.from_config(config)
+
+
+@pytest.mark.parametrize("compensation, accepted", [
+    ({"from": 100000, "to": 140000, "currencyCode": "RUR"}, False),
+    ({"from": 100000, "to": 160000, "currencyCode": "RUR"}, True),
+    ({"from": 160000, "currencyCode": "RUR"}, True),
+    ({"to": 140000, "currencyCode": "RUR"}, False),
+    ({"from": 5000, "currencyCode": "USD"}, False),
+    ({"noCompensation": True}, True),
+])
+def test_filter_vacancies_salary_min(compensation, accepted):
+    vacancy_filter = VacancyFilter.from_config({"salary": {"min": 150000}})
+
+    assert bool(vacancy_filter.filter_vacancies([make_vacancy(compensation=compensation)])) is accepted
+
+
+def test_filter_vacancies_salary_max_and_missing_salary():
+    vacancy_filter = VacancyFilter.from_config({"salary": {"max": 300000, "allow_missing": False}})
+    vacancies = [
+        make_vacancy("fits"),
+        make_vacancy("too high", compensation={"from": 350000, "currencyCode": "RUR"}),
+        make_vacancy("no salary", compensation={"noCompensation": True}),
+    ]
+
+    assert names(vacancy_filter.filter_vacancies(vacancies)) == ["fits"]
+
+
+def test_filter_vacancies_missing_salary_without_bounds():
+    vacancy_filter = VacancyFilter.from_config({"salary": {"allow_missing": False}})
+    vacancies = [make_vacancy("with salary"), make_vacancy("no salary", compensation={"noCompensation": True})]
+
+    assert not vacancy_filter.is_empty
+    assert names(vacancy_filter.filter_vacancies(vacancies)) == ["with salary"]
+
+
+def test_filter_vacancies_allow_other_currency():
+    vacancy_filter = VacancyFilter.from_config({"salary": {"min": 150000, "allow_other_currency": True}})
+    vacancy = make_vacancy(compensation={"from": 5000, "currencyCode": "USD"})
+
+    assert vacancy_filter.filter_vacancies([vacancy]) == [vacancy]
+
+
+def test_filter_vacancies_employer_allow_and_deny():
+    deny_filter = VacancyFilter.from_config({"employers": {"deny": ["bad company", 20]}})
+    allow_filter = VacancyFilter.from_config({"employers": {"allow": ["10"]}})
+    vacancies = [
+        make_vacancy("good"),
+        make_vacancy("bad by name", company={"@id": 30, "name": "Bad Company"}),
+        make_vacancy("bad by id", company={"@id": 20, "name": "Other"}),
+    ]
+
+    assert names(deny_filter.filter_vacancies(vacancies)) == ["good"]
+    assert names(allow_filter.filter_vacancies(vacancies)) == ["good"]
+
+
+def test_filter_vacancies_area_and_schedule():
+    vacancy_filter = VacancyFilter.from_config({"areas": ["москва", 2], "schedules": ["remote"]})
+    vacancies = [
+        make_vacancy("moscow"),
+        make_vacancy("spb by id", area={"@id": 2, "name": "Санкт-Петербург"}),
+        make_vacancy("kazan", area={"@id": 88, "name": "Казань"}),
+        make_vacancy("office", **{"@workSchedule": "fullDay"}),
+    ]
+
+    assert names(vacancy_filter.filter_vacancies(vacancies)) == ["moscow", "spb by id"]
+
+
+def test_filter_vacancies_employer_cap_within_page_and_after_response():
+    vacancy_filter = VacancyFilter.from_config({"employers": {"max_responses": 1}})
+    first, second = make_vacancy("first"), make_vacancy("second")
+
+    assert vacancy_filter.filter_vacancies([first, second]) == [first]
+
+    vacancy_filter.record_response(first)
+    assert vacancy_filter.filter_vacancies([second]) == []
+
+
+def test_filter_vacancies_blacklisted_vacancy_does_not_use_employer_cap():
+    vacancy_filter = VacancyFilter.from_config({"employers": {"max_responses": 1}}, blacklist=["intern"])
+    vacancies = [make_vacancy("Java intern"), make_vacancy("Python dev")]
+
+    assert names(vacancy_filter.filter_vacancies(vacancies)) == ["Python dev"]
+
+
+def test_employer_cap_ignores_vacancies_without_employer():
+    vacancy_filter = VacancyFilter.from_config({"employers": {"max_responses": 1}})
+    vacancies = [make_vacancy("first", company={}), make_vacancy("second", company=None)]
+
+    vacancy_filter.record_response(vacancies[0])
+
+    assert vacancy_filter.employer_responses == {}
+    assert names(vacancy_filter.filter_vacancies(vacancies)) == ["first", "second"]
+
+
+def test_employer_cap_is_shared_between_queries():
+    employer_responses = {}
+    python_filter = VacancyFilter.from_config(
+        {"employers": {"max_responses": 1}}, employer_responses=employer_responses
+    )
+    backend_filter = VacancyFilter.from_config(
+        {"employers": {"max_responses": 1}}, employer_responses=employer_responses
+    )
+    python_vacancy, backend_vacancy = make_vacancy("Python dev"), make_vacancy("Backend dev")
+
+    assert python_filter.filter_vacancies([python_vacancy]) == [python_vacancy]
+    python_filter.record_response(python_vacancy)
+
+    assert backend_filter.filter_vacancies([backend_vacancy]) == []
@@ -0,0 +1,251 @@
+from typing import Dict, List, Optional, Set, Tuple
+
+from utils import is_vacancy_blacklisted
+
+# Допустимые ключи секции filters в accounts.json
+FILTER_KEYS = {"salary", "employers", "areas", "schedules"}
+SALARY_KEYS = {"min", "max", "currency", "allow_missing", "allow_other_currency"}
+EMPLOYER_KEYS = {"allow", "deny", "max_responses"}
+
+
+def _normalize_values(values: Optional[List]) -> Set[str]:
+    """Приводит список id/названий к множеству строк в нижнем регистре."""
+    return {str(value).strip().lower() for value in values or []}
+
+
+def _get_section(config: Dict, key: str, allowed_keys: Set[str]) -> Dict:
+    """Возвращает вложенную секцию фильтров и проверяет ее ключи."""
+    section = config.get(key) or {}
+    if not isinstance(section, dict):
+        raise ValueError(f"Фильтр '{key}' должен быть объектом")
+    unknown_keys = set(section) - allowed_keys
+    if unknown_keys:
+        raise ValueError(f"Неизвестные ключи в фильтре '{key}': {', '.join(sorted(unknown_keys))}")
+    return section
+
+
+def _get_int(section: Dict, key: str, name: str, minimum: Optional[int] = None) -> Optional[int]:
+    """Возвращает целочисленное значение фильтра или None, если оно не задано."""
+    value = section.get(key)
+    if value is None:
+        return None
+    try:
+        if isinstance(value, bool):
+            raise TypeError
+        result = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Фильтр '{name}' должен быть целым числом, получено: {value!r}")
+    if minimum is not None and result < minimum:
+        raise ValueError(f"Фильтр '{name}' должен быть не меньше {minimum}, получено: {value!r}")
+    return result
+
+
+def _get_bool(section: Dict, key: str, name: str, default: bool) -> bool:
+    """Возвращает логическое значение фильтра или значение по умолчанию."""
+    value = section.get(key, default)
+    if not isinstance(value, bool):
+        raise ValueError(f"Фильтр '{name}' должен быть true или false, получено: {value!r}")
+    return value
+
+
+def _get_list(config: Dict, key: str) -> List:
+    """Возвращает списочное значение фильтра."""
+    value = config.get(key) or []
+    if not isinstance(value, list):
+        raise ValueError(f"Фильтр '{key}' должен быть списком")
+    return value
+
+
+def _get_employer(vacancy: Dict) -> Tuple[str, str]:
+    """Возвращает id и название работодателя вакансии."""
+    company = vacancy.get("company") or {}
+    employer_id = company.get("@id", company.get("id", ""))
+    employer_name = company.get("visibleName") or company.get("name") or ""
+    return str(employer_id).lower(), employer_name.strip().lower()
+
+
+def _get_area(vacancy: Dict) -> Tuple[str, str]:
+    """Возвращает id и название региона вакансии."""
+    area = vacancy.get("area") or {}
+    area_id = area.get("@id", area.get("id", ""))
+    return str(area_id).lower(), (area.get("name") or "").strip().lower()
+
+
+def _get_schedule(vacancy: Dict) -> str:
+    """Возвращает формат работы вакансии."""
+    schedule = vacancy.get("@workSchedule") or vacancy.get("workSchedule") or ""
+    if isinstance(schedule, dict):
+        schedule = schedule.get("id", "")
+    return str(schedule).lower()
+
+
+class VacancyFilter:
+    """Класс для фильтрации вакансий по полям до отправки откликов."""
+
+    def __init__(
+        self,
+        salary_min: Optional[int] = None,
+        salary_max: Optional[int] = None,
+        currency: str = "RUR",
+        allow_no_salary: bool = True,
+        allow_other_currency: bool = False,
+        employers_allow: Optional[List] = None,
+        employers_deny: Optional[List] = None,
+        max_responses_per_employer: Optional[int] = None,
+        areas: Optional[List] = None,
+        schedules: Optional[List] = None,
+        blacklist: Optional[List[str]] = None,
+        employer_responses: Optional[Dict[str, int]] = None,
+    ):
+        self.salary_min = salary_min
+        self.salary_max = salary_max
+        self.currency = currency
+        self.allow_no_salary = allow_no_salary
+        self.allow_other_currency = allow_other_currency
+        self.employers_allow = _normalize_values(employers_allow)
+        self.employers_deny = _normalize_values(employers_deny)
+        self.max_responses_per_employer = max_responses_per_employer
+        self.areas = _normalize_values(areas)
+        self.schedules = _normalize_values(schedules)
+        self.blacklist = blacklist or []  # Исключаемые слова в названии вакансии
+        # Отклики по работодателям за текущий запуск, общий словарь для всех фильтров
+        self.employer_responses = employer_responses if employer_responses is not None else {}
+
+    @classmethod
+    def from_config(
+        cls,
+        config: Optional[Dict],
+        blacklist: Optional[List[str]] = None,
+        employer_responses: Optional[Dict[str, int]] = None,
+    ) -> "VacancyFilter":
+        """Создает фильтр из секции filters в accounts.json, проверяя ее корректность."""
+        config = config or {}
+        if not isinstance(config, dict):
+            raise ValueError("Секция 'filters' должна быть объектом")
+        unknown_keys = set(config) - FILTER_KEYS
+        if unknown_keys:
+            raise ValueError(f"Неизвестные ключи в секции 'filters': {', '.join(sorted(unknown_keys))}")
+
+        salary = _get_section(config, "salary", SALARY_KEYS)
+        employers = _get_section(config, "employers", EMPLOYER_KEYS)
+        return cls(
+            salary_min=_get_int(salary, "min", "salary.min"),
+            salary_max=_get_int(salary, "max", "salary.max"),
+            currency=str(salary.get("currency") or "RUR"),
+            allow_no_salary=_get_bool(salary, "allow_missing", "salary.allow_missing", True),
+            allow_other_currency=_get_bool(salary, "allow_other_currency", "salary.allow_other_currency", False),
+            employers_allow=_get_list(employers, "allow"),
+            employers_deny=_get_list(employers, "deny"),
+            # Нулевой лимит не допускается: чтобы не откликаться работодателю, используйте deny
+            max_responses_per_employer=_get_int(employers, "max_responses", "employers.max_responses", minimum=1),
+            areas=_get_list(config, "areas"),
+            schedules=_get_list(config, "schedules"),
+            blacklist=blacklist,
+            employer_responses=employer_responses,
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        """Проверяет, задано ли хотя бы одно ограничение."""
+        return (
+            self.salary_min is None
+            and self.salary_max is None
+            and self.allow_no_salary
+            and not self.employers_allow
+            and not self.employers_deny
+            and self.max_responses_per_employer is None
+            and not self.areas
+            and not self.schedules
+            and not self.blacklist
+        )
+
+    def _check_blacklist(self, vacancy: Dict) -> Optional[str]:
+        """Проверяет название вакансии по blacklist, возвращает причину отказа или None."""
+        if is_vacancy_blacklisted(vacancy["name"], self.blacklist):
+            return "blacklist"
+        return None
+
+    def _check_salary(self, vacancy: Dict) -> Optional[str]:
+        """Проверяет зарплату вакансии, возвращает причину отказа или None."""
+        compensation = vacancy.get("compensation") or {}
+        salary_from = compensation.get("from")
+        salary_to = compensation.get("to")
+        if compensation.get("noCompensation") or (salary_from is None and salary_to is None):
+            return None if self.allow_no_salary else "зарплата не указана"
+
+        if self.salary_min is None and self.salary_max is None:
+            return None
+
+        currency = compensation.get("currencyCode")
+        if currency and currency != self.currency:
+            # Зарплаты в разных валютах не сравниваем
+            return None if self.allow_other_currency else "зарплата в другой валюте"
+
+        if self.salary_min is not None and (salary_to or salary_from) < self.salary_min:
+            return "зарплата ниже минимума"
+        if self.salary_max is not None and (salary_from or salary_to) > self.salary_max:
+            return "зарплата выше максимума"
+        return None
+
+    def _check_employer(self, employer_id: str, employer_name: str) -> Optional[str]:
+        """Проверяет работодателя по спискам, возвращает причину отказа или None."""
+        employer_keys = {employer_id, employer_name}
+        if self.employers_deny & employer_keys:
+            return "работодатель в черном списке"
+        if self.employers_allow and not self.employers_allow & employer_keys:
+            return "работодатель не в белом списке"
+        return None
+
+    def _check_area(self, vacancy: Dict) -> Optional[str]:
+        """Проверяет регион вакансии, возвращает причину отказа или None."""
+        if self.areas and not self.areas & set(_get_area(vacancy)):
+            return "неподходящий регион"
+        return None
+
+    def _check_schedule(self, vacancy: Dict) -> Optional[str]:
+        """Проверяет формат работы вакансии, возвращает причину отказа или None."""
+        if self.schedules and _get_schedule(vacancy) not in self.schedules:
+            return "неподходящий формат работы"
+        return None
+
+    def filter_vacancies(self, vacancies: List[Dict]) -> List[Dict]:
+        """Отбирает вакансии страницы, на которые стоит откликаться."""
+        if self.is_empty:
+            return vacancies
+
+        accepted = []
+        page_responses: Dict[str, int] = {}  # Отклики, запланированные на этой странице
+
+        for vacancy in vacancies:
+            employer_id, employer_name = _get_employer(vacancy)
+            reason = (
+                self._check_blacklist(vacancy)
+                or self._check_salary(vacancy)
+                or self._check_employer(employer_id, employer_name)
+                or self._check_area(vacancy)
+                or self._check_schedule(vacancy)
+            )
+
+            employer_key = employer_id or employer_name
+            # Вакансии без id и названия работодателя лимитом не ограничиваем
+            if reason is None and self.max_responses_per_employer is not None and employer_key:
+                planned = self.employer_responses.get(employer_key, 0) + page_responses.get(employer_key, 0)
+                if planned >= self.max_responses_per_employer:
+                    reason = "лимит откликов работодателю"
+                else:
+                    page_responses[employer_key] = page_responses.get(employer_key, 0) + 1
+
+            if reason is not None:
+                print(f"Вакансия пропущена ({reason}): {vacancy['name']}")
+                continue
+            accepted.append(vacancy)
+
+        return accepted
+
+    def record_response(self, vacancy: Dict) -> None:
+        """Учитывает отправленный отклик для лимита по работодателю."""
+        employer_id, employer_name = _get_employer(vacancy)
+        employer_key = employer_id or employer_name
+        if not employer_key:
+            return
+        self.employer_responses[employer_key] = self.employer_responses.get(employer_key, 0) + 1
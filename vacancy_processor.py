@@ -2,7 +2,7 @@ import asyncio
 from typing import Dict, List
 
 from models import AccountResumePair
-from utils import is_vacancy_blacklisted
+from vacancy_filter import VacancyFilter
 from api import get_vacancies, get_vacancies_pages
 
 async def process_vacancy(
@@ -10,15 +10,11 @@ async def process_vacancy(
     relevant_pairs: List[AccountResumePair],  # Только релевантные пары для данного поискового запроса
     exhausted_pairs: List[int],
     pair_lock: asyncio.Lock,
-    pair_index: List[int]
+    pair_index: List[int],
+    vacancy_filter: VacancyFilter
 ) -> None:
     """Обрабатывает вакансию и отправляет отклик, если это возможно."""
     name = vacancy["name"]
-    
-    # Проверяем blacklist для первой найденной пары (у всех пар одинаковый query и blacklist)
-    if relevant_pairs and is_vacancy_blacklisted(name, relevant_pairs[0].resume.blacklist):
-        print(f"Вакансия пропущена (blacklist): {name}")
-        return
 
     async with pair_lock:
         # Фильтруем только неисчерпанные пары из релевантных
@@ -35,6 +31,7 @@ async def process_vacancy(
 
     resp = await pair.account.respond_to_vacancy(vacancy["vacancyId"], pair.resume)
     if resp["success"]:
+        vacancy_filter.record_response(vacancy)
         print(f"Отклик отправлен на вакансию: {name} (резюме: {pair.resume.query}, аккаунт: {pair.account.email})")
     else:
         error = resp["error"]
@@ -72,6 +69,9 @@ async def process_resume_vacancies(
     last_page = await get_vacancies_pages(session, search_query, experience_list, website_version)
     print(f"Найдено страниц для '{search_query}': {last_page}")
     
+    # Фильтр берем из первой пары: main проверяет, что у резюме с одним query одинаковые фильтры
+    vacancy_filter = relevant_pairs[0].resume.vacancy_filter
+    
     for page in range(0, last_page + 1):
         # Проверяем доступные пары перед каждой страницей
         available_pairs = [pair for pair in relevant_pairs if pair.pair_id not in exhausted_pairs]
@@ -82,8 +82,11 @@ async def process_resume_vacancies(
         vacancies = await get_vacancies(session, search_query, page, experience_list, website_version)
         print(f"Обрабатываем страницу {page}/{last_page} для '{search_query}' ({len(vacancies)} вакансий)")
         
+        # Отсеиваем неподходящие вакансии (включая blacklist) до отправки откликов, чтобы не тратить лимит
+        vacancies = vacancy_filter.filter_vacancies(vacancies)
+        
         tasks = [
-            process_vacancy(vacancy, relevant_pairs, exhausted_pairs, pair_lock, pair_index)
+            process_vacancy(vacancy, relevant_pairs, exhausted_pairs, pair_lock, pair_index, vacancy_filter)
             for vacancy in vacancies
         ]
         await asyncio.gather(*tasks)